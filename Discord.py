@@ -7,6 +7,7 @@ import json
 from datetime import datetime
 import asyncio
 import re
+import tempfile
 import traceback
 import aiohttp
 import importlib.util
@@ -37,17 +38,31 @@ logger = logging.getLogger(__name__)
 # Define the paths to the files
 CHANGELOG_PATH = "/app/changelog.md"  # Using the same path as in Patcher_API.py
 SERVER_STATUS_PATH = "/app/ServerStatus.md"  # New path for server status
+LAST_MESSAGE_PATH = "/app/last_message.json"
 
-# Set up Discord client with reconnect enabled
-intents = discord.Intents.default()
-intents.message_content = True
+# Set up Discord client with reconnect enabled, subscribed only to the
+# gateway events the bot handles (the message cache is unused)
+intents = discord.Intents.none()
 intents.guilds = True  # Needed for channel updates
-client = discord.Client(intents=intents, reconnect=True)
+intents.guild_messages = True
+intents.message_content = True
+client = discord.Client(intents=intents, reconnect=True, max_messages=None)
 
 # Define health check intervals
 HEALTH_CHECK_INTERVAL = 120  # 2 minutes for stable heartbeat
 HEARTBEAT_INITIAL_INTERVAL = 30  # 30 seconds for initial heartbeats
 
+# Newest changelog channel message ID already reflected in changelog.md.
+# Lets the heartbeat poll skip the file read and history call when the
+# gateway hasn't seen anything newer.
+last_synced_message_id = None
+
+def mark_changelog_synced(message_id):
+    """Record that changelog.md is up to date through the given message ID"""
+    global last_synced_message_id
+    if last_synced_message_id is None or message_id > last_synced_message_id:
+        last_synced_message_id = message_id
+
 async def sync_changelog_on_startup():
     """Fetch all messages from the changelog channel and update changelog.md with any new ones."""
     try:
@@ -64,17 +79,20 @@ async def sync_changelog_on_startup():
                 existing_ids = set([m for m in re.findall(r"## Entry (\d+)", content)])
         # Fetch all messages from the channel
         new_entries = []
+        newest_id = None
         async for message in channel.history(limit=None, oldest_first=True):
+            newest_id = message.id
             if str(message.id) not in existing_ids and message.content.strip():
                 logger.info(f"Adding missed changelog entry: {message.id}")
                 new_entries.append(message)
         # Add new entries to changelog.md
         if new_entries:
             logger.info(f"Adding {len(new_entries)} missed changelog entries to changelog.md")
-            for msg in new_entries:
-                await update_changelog_file(msg)
+            await update_changelog_file(*new_entries)
         else:
             logger.info("No missed changelog entries found.")
+        if newest_id is not None:
+            mark_changelog_synced(newest_id)
     except Exception as e:
         logger.error(f"Error syncing changelog on startup: {str(e)}")
         logger.error(traceback.format_exc())
@@ -117,92 +135,94 @@ async def health_check():
     
     check_count = 0
     
-    while not client.is_closed():
-        check_count += 1
-        try:
-            # Calculate latency in milliseconds
-            latency_ms = client.latency * 1000
+    # One session for the whole loop so the gateway ping reuses a kept-alive
+    # connection instead of a fresh TCP + TLS handshake every check
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15)) as session:
+        while not client.is_closed():
+            check_count += 1
+            try:
+                # Calculate latency in milliseconds
+                latency_ms = client.latency * 1000
             
-            # Build a more detailed heartbeat message with multiple lines of information
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            heartbeat_lines = [
-                f"Discord health check #{check_count}",
-                f"Time: {current_time}",
-                f"Bot: {client.user.name} (ID: {client.user.id})",
-                f"Connection: Active, latency: {latency_ms:.2f}ms",
-                f"Interval: {current_interval}s"
-            ]
+                # Build a more detailed heartbeat message with multiple lines of information
+                current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                heartbeat_lines = [
+                    f"Discord health check #{check_count}",
+                    f"Time: {current_time}",
+                    f"Bot: {client.user.name} (ID: {client.user.id})",
+                    f"Connection: Active, latency: {latency_ms:.2f}ms",
+                    f"Interval: {current_interval}s"
+                ]
             
-            # Add info about channels being monitored
-            changelog_channel = client.get_channel(CHANGELOG_CHANNEL_ID)
-            if changelog_channel:
-                heartbeat_lines.append(f"Monitoring changelog channel: #{changelog_channel.name}")
+                # Add info about channels being monitored
+                changelog_channel = client.get_channel(CHANGELOG_CHANNEL_ID)
+                if changelog_channel:
+                    heartbeat_lines.append(f"Monitoring changelog channel: #{changelog_channel.name}")
                 
-                # Check for new changelog messages during heartbeat
-                updates_found = await check_for_changelog_updates()
-                heartbeat_lines.append(f"Changelog check: {'Updates found and applied' if updates_found else 'No new updates'}")
+                    # Check for new changelog messages during heartbeat
+                    updates_found = await check_for_changelog_updates()
+                    heartbeat_lines.append(f"Changelog check: {'Updates found and applied' if updates_found else 'No new updates'}")
             
-            if EXP_BOOST_CHANNEL_ID:
-                exp_channel = client.get_channel(EXP_BOOST_CHANNEL_ID)
-                if exp_channel:
-                    heartbeat_lines.append(f"Monitoring EXP boost channel: #{exp_channel.name}")
+                if EXP_BOOST_CHANNEL_ID:
+                    exp_channel = client.get_channel(EXP_BOOST_CHANNEL_ID)
+                    if exp_channel:
+                        heartbeat_lines.append(f"Monitoring EXP boost channel: #{exp_channel.name}")
             
-            # Join everything into a multi-line message for the heartbeat log
-            heartbeat_message = "\n".join(heartbeat_lines)
+                # Join everything into a multi-line message for the heartbeat log
+                heartbeat_message = "\n".join(heartbeat_lines)
             
-            # Use special Azure heartbeat logging for better visibility
-            force_azure_heartbeat_log(heartbeat_message)
+                # Use special Azure heartbeat logging for better visibility
+                force_azure_heartbeat_log(heartbeat_message)
             
-            # Ping Discord's API to keep connection active
-            async with aiohttp.ClientSession() as session:
+                # Ping Discord's API to keep connection active
                 async with session.get('https://discord.com/api/v10/gateway') as resp:
                     gateway_status = "HEALTHY" if resp.status == 200 else f"WARNING ({resp.status})"
                     logger.info(f"Discord API gateway connection: {gateway_status}")
                     if resp.status != 200:
                         logger.warning(f"Discord API gateway returned status code: {resp.status}")
             
-            # Update bot status to show it's active
-            await client.change_presence(
-                activity=discord.Activity(
-                    type=discord.ActivityType.watching, 
-                    name=f"for updates | {datetime.now().strftime('%H:%M:%S')}"
+                # Update bot status to show it's active
+                await client.change_presence(
+                    activity=discord.Activity(
+                        type=discord.ActivityType.watching, 
+                        name=f"for updates | {datetime.now().strftime('%H:%M:%S')}"
+                    )
                 )
-            )
             
-            # Check channel access
-            if client.get_channel(CHANGELOG_CHANNEL_ID) is None:
-                logger.warning(f"Cannot access changelog channel {CHANGELOG_CHANNEL_ID}")
+                # Check channel access
+                if client.get_channel(CHANGELOG_CHANNEL_ID) is None:
+                    logger.warning(f"Cannot access changelog channel {CHANGELOG_CHANNEL_ID}")
             
-            if EXP_BOOST_CHANNEL_ID and client.get_channel(EXP_BOOST_CHANNEL_ID) is None:
-                logger.warning(f"Cannot access exp boost channel {EXP_BOOST_CHANNEL_ID}")
+                if EXP_BOOST_CHANNEL_ID and client.get_channel(EXP_BOOST_CHANNEL_ID) is None:
+                    logger.warning(f"Cannot access exp boost channel {EXP_BOOST_CHANNEL_ID}")
                 
-        except Exception as e:
-            logger.error(f"Error during health check: {str(e)}")
-            logger.error(traceback.format_exc())
+            except Exception as e:
+                logger.error(f"Error during health check: {str(e)}")
+                logger.error(traceback.format_exc())
         
-        # Calculate the interval for the next check
-        # Gradually increase from initial_interval to max_interval
-        if check_count < initial_checks:
-            # Keep initial interval for the first few checks
-            interval = initial_interval
-        else:
-            # Gradually increase interval
-            progress = min(1.0, (check_count - initial_checks) / 10)  # Transition over 10 checks
-            interval = int(initial_interval + progress * (max_interval - initial_interval))
+            # Calculate the interval for the next check
+            # Gradually increase from initial_interval to max_interval
+            if check_count < initial_checks:
+                # Keep initial interval for the first few checks
+                interval = initial_interval
+            else:
+                # Gradually increase interval
+                progress = min(1.0, (check_count - initial_checks) / 10)  # Transition over 10 checks
+                interval = int(initial_interval + progress * (max_interval - initial_interval))
             
-            # Once we reach maximum interval, stay there
-            if interval >= max_interval:
-                interval = max_interval
-                # Log that we've reached stable interval
-                if current_interval != max_interval:
-                    logger.info(f"Health check interval has reached stable value of {max_interval} seconds")
+                # Once we reach maximum interval, stay there
+                if interval >= max_interval:
+                    interval = max_interval
+                    # Log that we've reached stable interval
+                    if current_interval != max_interval:
+                        logger.info(f"Health check interval has reached stable value of {max_interval} seconds")
         
-        # If interval changed, log it
-        if interval != current_interval:
-            logger.info(f"Health check interval adjusted from {current_interval} to {interval} seconds")
-            current_interval = interval
+            # If interval changed, log it
+            if interval != current_interval:
+                logger.info(f"Health check interval adjusted from {current_interval} to {interval} seconds")
+                current_interval = interval
         
-        await asyncio.sleep(interval)
+            await asyncio.sleep(interval)
 
 @client.event
 async def on_ready():
@@ -222,12 +242,13 @@ async def on_ready():
     await sync_changelog_on_startup()
     
     # Check for and update EXP boost status on startup
-    for guild in client.guilds:
-        for channel in guild.channels:
-            if channel.id == EXP_BOOST_CHANNEL_ID:
-                logger.info(f"Found EXP boost channel: {channel.name}")
-                await update_server_status_from_channel(channel)
-                break
+    if EXP_BOOST_CHANNEL_ID:
+        exp_channel = client.get_channel(EXP_BOOST_CHANNEL_ID)
+        if exp_channel:
+            logger.info(f"Found EXP boost channel: {exp_channel.name}")
+            await update_server_status_from_channel(exp_channel)
+        else:
+            logger.error(f"Could not find EXP boost channel with ID {EXP_BOOST_CHANNEL_ID}")
     
     # Set initial status
     await client.change_presence(
@@ -267,16 +288,15 @@ async def on_guild_channel_update(before, after):
 
 @client.event
 async def on_message(message):
-    # Debug log for ALL messages
-    logger.info(f"MESSAGE RECEIVED - Channel: {message.channel.id}, Author: {message.author}, Content: {message.content[:50]}...")
-
-    # Specific handler for changelog channel
+    # Only the changelog channel is handled; every other message is dropped
+    # here without formatting or logging anything for it
     if message.channel.id == CHANGELOG_CHANNEL_ID:
         logger.info(f"CHANGELOG MESSAGE DETECTED - Content: {message.content}")
         
         # Update the changelog.md file with the new message
         try:
             await update_changelog_file(message)
+            mark_changelog_synced(message.id)
             logger.info("Successfully updated changelog.md file")
 
             
@@ -336,15 +356,18 @@ async def update_server_status_from_channel(channel):
                 
                 # Replace the EXP Boost Status section
                 if "## EXP Boost Status" in content:
-                    parts = content.split("## EXP Boost Status\n\n", 1)
-                    second_part = parts[1].split("\n\n## ", 1)
+                    # Split on the bare header so the section is found even if
+                    # the header isn't followed by a blank line; whatever was on
+                    # the rest of that line is replaced along with the section
+                    before, _, section = content.partition("## EXP Boost Status")
+                    _, next_header, following = section.partition("\n\n## ")
                     
-                    if len(second_part) > 1:
+                    if next_header:
                         # If there are other sections after EXP Boost
-                        content = parts[0] + "## EXP Boost Status\n\n" + new_entry + "\n\n## " + second_part[1]
+                        content = before + "## EXP Boost Status\n\n" + new_entry + "\n\n## " + following
                     else:
                         # If EXP Boost is the only or last section
-                        content = parts[0] + "## EXP Boost Status\n\n" + new_entry
+                        content = before + "## EXP Boost Status\n\n" + new_entry
                 else:
                     # If EXP Boost section doesn't exist, add it at the end
                     content += "\n\n## EXP Boost Status\n\n" + new_entry
@@ -369,8 +392,8 @@ async def update_server_status_from_channel(channel):
         logger.error(traceback.format_exc())
         raise
 
-async def update_changelog_file(message):
-    """Update the changelog.md file with a new message"""
+async def update_changelog_file(*messages):
+    """Update the changelog.md file with one or more new messages, given oldest first"""
     try:
         # Log file path and check permissions
         logger.info(f"Attempting to update changelog file at: {CHANGELOG_PATH}")
@@ -404,8 +427,9 @@ async def update_changelog_file(message):
             except Exception as e:
                 logger.error(f"Directory permission issue: {str(e)}")
         
-        # Format the new entry
-        new_entry = format_changelog_entry(message)
+        # Format the new entries, newest first to match the file order, so a
+        # batch of messages costs a single read and write of the file
+        new_entry = "".join([format_changelog_entry(m) for m in reversed(messages)])
         
         # Check if file exists
         if not os.path.exists(CHANGELOG_PATH):
@@ -422,8 +446,11 @@ async def update_changelog_file(message):
                 
                 # Add new entry after the header, at the top of the entries
                 if "# Changelog" in content:
-                    parts = content.split("# Changelog\n\n", 1)
-                    content = "# Changelog\n\n" + new_entry + parts[1] if len(parts) > 1 else "# Changelog\n\n" + new_entry
+                    # Split on the bare header so the entries survive even if
+                    # the header isn't followed by a blank line
+                    _, _, existing_entries = content.partition("# Changelog")
+                    existing_entries = existing_entries.lstrip("\n")
+                    content = "# Changelog\n\n" + new_entry + existing_entries
                 else:
                     # If for some reason header is missing, add it
                     content = "# Changelog\n\n" + new_entry + content
@@ -438,8 +465,10 @@ async def update_changelog_file(message):
         with open(CHANGELOG_PATH, "w") as md_file:
             md_file.write(content)
             
-        # Also save the last message ID to a file for tracking
-        save_last_message_info(message)
+        # Also save the last message ID to a file for tracking - the fsync
+        # can stall for a while, so keep it off the event loop, one save at a time
+        async with last_message_lock:
+            await asyncio.to_thread(save_last_message_info, messages[-1])
         
     except Exception as e:
         logger.error(f"Error in update_changelog_file: {str(e)}")
@@ -448,15 +477,26 @@ async def update_changelog_file(message):
 
 def format_changelog_entry(message):
     """Format a Discord message as a changelog entry"""
-    entry = f"## Entry {message.id}\n"
-    entry += f"**Author:** {message.author.display_name}\n"
-    entry += f"**Date:** {message.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    entry += f"{message.content}\n\n"
-    entry += "---\n\n"
-    return entry
+    return "".join([
+        f"## Entry {message.id}\n",
+        f"**Author:** {message.author.display_name}\n",
+        f"**Date:** {message.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        f"{message.content}\n\n",
+        "---\n\n",
+    ])
+
+# ID of the message last written to last_message.json, and the lock that keeps
+# saves (which run in worker threads) from overlapping
+last_saved_message_id = None
+last_message_lock = asyncio.Lock()
 
 def save_last_message_info(message):
     """Save information about the last processed message"""
+    global last_saved_message_id
+    # Never overwrite a newer message with an older one
+    if last_saved_message_id is not None and message.id <= last_saved_message_id:
+        return
+
     data = {
         "id": str(message.id),
         "author": message.author.display_name,
@@ -466,8 +506,21 @@ def save_last_message_info(message):
     }
     
     try:
-        with open("/app/last_message.json", "w") as f:
-            json.dump(data, f, indent=2)
+        # Write to a temp file and swap it in so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(LAST_MESSAGE_PATH), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates the file owner-only; keep it readable like before
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, LAST_MESSAGE_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        last_saved_message_id = message.id
     except Exception as e:
         logger.error(f"Error saving last_message.json: {str(e)}")
         logger.error(traceback.format_exc())
@@ -501,6 +554,15 @@ def import_reddit_poster():
 
 # Run the client with proper reconnection handling
 if __name__ == "__main__":
+    # client.run() creates its own event loop, so install uvloop's policy first
+    # when it's available (it isn't on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        logger.info("uvloop not installed, using default asyncio event loop")
+
     # Try to handle keyboard interrupts gracefully
     try:
         logger.info("Starting Discord bot...")
@@ -549,6 +611,13 @@ async def check_for_changelog_updates():
             logger.error(f"Changelog channel with ID {CHANGELOG_CHANNEL_ID} not found.")
             return False
         
+        # The gateway keeps last_message_id current, so if it isn't newer than
+        # what we've already synced there is nothing to fetch or compare
+        if (last_synced_message_id is not None and channel.last_message_id is not None
+                and channel.last_message_id <= last_synced_message_id):
+            logger.info("No new changelog messages since last sync.")
+            return False
+        
         # Read existing changelog entries to avoid duplicates
         existing_ids = set()
         if os.path.exists(CHANGELOG_PATH):
@@ -560,7 +629,10 @@ async def check_for_changelog_updates():
         
         # Get recent messages from the channel (limit to last 50 to be efficient)
         new_entries = []
+        newest_id = None
         async for message in channel.history(limit=50):
+            if newest_id is None:
+                newest_id = message.id
             if str(message.id) not in existing_ids and message.content.strip():
                 logger.info(f"Found new changelog entry: {message.id}")
                 new_entries.append(message)
@@ -570,11 +642,13 @@ async def check_for_changelog_updates():
             logger.info(f"Adding {len(new_entries)} new changelog entries to changelog.md")
             # Sort by timestamp to ensure oldest first
             new_entries.sort(key=lambda msg: msg.created_at)
-            for msg in new_entries:
-                await update_changelog_file(msg)
+            await update_changelog_file(*new_entries)
+            mark_changelog_synced(newest_id)
             return True
         else:
             logger.info("No new changelog entries found.")
+            if newest_id is not None:
+                mark_changelog_synced(newest_id)
             return False
             
     except Exception as e:
@@ -1,35 +1,43 @@
 import os
 import discord
-from fastapi import FastAPI, HTTPException, Security, Depends, Request, Response
+from fastapi import FastAPI, HTTPException, Security, Depends, Request, Response, Query
 from dotenv import load_dotenv
 from datetime import datetime
 import asyncio
+import functools
+import hashlib
+import hmac
 import uvicorn
+from collections import deque
+from itertools import islice
+from bisect import bisect_left, bisect_right
 from typing import Optional, Callable
 import aiohttp
 from fastapi.security import APIKeyHeader
 import json
+import orjson
+import gzip
 import logging
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener
 import sys
 import requests
 from fastapi.background import BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 import markdown
 import re
 import time
+import random
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 import importlib.util
 import traceback
 
 # Configure logging for Azure
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Handlers on the event loop only enqueue records; a background listener
+# thread does the blocking write to stdout.
+log_queue = queue.SimpleQueue()
 
 # Get the root logger
 root_logger = logging.getLogger()
@@ -39,11 +47,15 @@ root_logger.setLevel(logging.INFO)
 for handler in root_logger.handlers[:]:
     root_logger.removeHandler(handler)
 
-# Add stdout handler to root logger
+# Add stdout handler behind the queue
 stdout_handler = logging.StreamHandler(sys.stdout)
 stdout_handler.setFormatter(logging.Formatter(
     '%(asctime)s [%(levelname)s] %(message)s'))
-root_logger.addHandler(stdout_handler)
+root_logger.addHandler(QueueHandler(log_queue))
+
+log_listener = QueueListener(log_queue, stdout_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +71,8 @@ TOKEN = os.getenv('DISCORD_TOKEN')
 CHANGELOG_CHANNEL_ID = int(os.getenv('CHANGELOG_CHANNEL_ID'))
 EXP_BOOST_CHANNEL_ID = os.getenv('EXP_BOOST_CHANNEL_ID')
 PATCHER_TOKEN = os.getenv('PATCHER_TOKEN')
+# Encoded once for constant-time comparison against request tokens
+PATCHER_TOKEN_BYTES = PATCHER_TOKEN.encode() if PATCHER_TOKEN else None
 
 # Convert EXP_BOOST_CHANNEL_ID to int if it exists
 if EXP_BOOST_CHANNEL_ID:
@@ -71,6 +85,18 @@ else:
 WIKI_API_URL = os.getenv('WIKI_API_URL')
 WIKI_API_KEY = os.getenv('WIKI_API_KEY')
 WIKI_PAGE_ID = os.getenv('WIKI_PAGE_ID')
+# Parse the page ID once so a malformed value fails at startup, not per request
+if WIKI_PAGE_ID and not WIKI_PAGE_ID.strip().isdigit():
+    logger.error("❌ WIKI_PAGE_ID must be a numeric page ID, got %r", WIKI_PAGE_ID)
+    raise ValueError("WIKI_PAGE_ID environment variable must be a number")
+WIKI_PAGE_ID_INT = int(WIKI_PAGE_ID) if WIKI_PAGE_ID else None
+# Wiki updates need all three settings; decided once at startup
+WIKI_ENABLED = bool(WIKI_API_URL and WIKI_API_KEY and WIKI_PAGE_ID)
+# Headers sent with every Wiki.js GraphQL request
+WIKI_HEADERS = {
+    'Authorization': f'Bearer {WIKI_API_KEY}',
+    'Content-Type': 'application/json'
+}
 
 # Ensure we use the port provided by Azure
 PORT = int(os.getenv('PORT', '80'))
@@ -98,8 +124,31 @@ def mask_sensitive_string(s: str) -> str:
     return f"{s[:4]}...{s[-4:]}"
 
 
+# English month names for the wiki date headers, so formatting doesn't go
+# through the locale-aware strftime on every entry
+MONTH_NAMES = ("January", "February", "March", "April", "May", "June", "July",
+               "August", "September", "October", "November", "December")
+# Runs of blank lines in a changelog message, collapsed to one for the wiki
+MULTIPLE_BLANK_LINES = re.compile(r'\n{3,}')
+
+
+@functools.lru_cache(maxsize=None)
+def format_changelog_for_wiki(content: str, timestamp: datetime, author: str) -> str:
+    """
+    Format a changelog message as a wiki entry.
+    Memoized so each distinct message is only formatted once across requests.
+    Unbounded on purpose: a page rebuild formats every entry in order, which
+    would keep evicting the next rebuild's entries from any smaller LRU, and
+    the entries themselves are bounded by changelog.md.
+    """
+    body = MULTIPLE_BLANK_LINES.sub('\n\n', content.replace('```', '').strip())
+    return (f"# {MONTH_NAMES[timestamp.month - 1]} {timestamp.day:02d}, {timestamp.year}\n"
+            f"## {author}\n\n"
+            f"{body}\n\n---\n\n")
+
+
 # Verify required environment variables
-print("\n=== Environment Check ===")
+logger.info("=== Environment Check ===")
 required_vars = {
     'DISCORD_TOKEN': TOKEN,
     'CHANGELOG_CHANNEL_ID': CHANGELOG_CHANNEL_ID,
@@ -108,13 +157,13 @@ required_vars = {
 
 for var_name, var_value in required_vars.items():
     if not var_value:
-        print(f"❌ {var_name} is missing!")
+        logger.error("❌ %s is missing!", var_name)
         raise ValueError(f"{var_name} environment variable is required")
     else:
-        print(f"✓ {var_name} configured")
+        logger.info("✓ %s configured", var_name)
 
 # Log Wiki variables status
-print("\n=== Optional Wiki Variables ===")
+logger.info("=== Optional Wiki Variables ===")
 wiki_vars = {
     'WIKI_API_URL': WIKI_API_URL,
     'WIKI_API_KEY': WIKI_API_KEY,
@@ -124,20 +173,63 @@ wiki_vars = {
 
 for var_name, var_value in wiki_vars.items():
     status = "✓ configured" if var_value else "⚪ not set (optional)"
-    print(f"{var_name}: {status}")
+    logger.info("%s: %s", var_name, status)
 
-print("=== Environment Check Complete ===\n")
+logger.info("=== Environment Check Complete ===")
 
-# Set up Discord client
-intents = discord.Intents.default()
-intents.message_content = True
+# Set up Discord client - only subscribe to the gateway events we use, and skip
+# discord.py's message cache since recent changelogs are cached separately
+intents = discord.Intents.none()
 intents.guilds = True
-client = discord.Client(intents=intents)
+intents.guild_messages = True
+intents.message_content = True
+client = discord.Client(
+    intents=intents, chunk_guilds_at_startup=False, max_messages=None)
 
 # Global variables for channels
 changelog_channel = None
 exp_boost_channel = None
 
+# Shared HTTP session (created on FastAPI startup) so outbound requests to
+# Wiki.js and the server status proxy reuse pooled keep-alive connections
+http_session: Optional[aiohttp.ClientSession] = None
+
+# How long the background startup tasks wait for the Discord client to become
+# ready; they don't hold up the API, so this can comfortably cover a slow login
+DISCORD_READY_TIMEOUT = 120
+# Set by on_ready. Unlike client.wait_until_ready(), this can be awaited before
+# the client has started logging in.
+discord_ready = asyncio.Event()
+
+# Most recent changelog messages (newest first), seeded once in on_ready and
+# kept current by on_message so endpoints don't hit Discord history per request
+RECENT_CHANGELOG_LIMIT = 50
+recent_changelogs = deque(maxlen=RECENT_CHANGELOG_LIMIT)
+recent_changelogs_lock = asyncio.Lock()
+
+
+async def wait_for_discord_ready() -> bool:
+    """Wait until the Discord client is ready, returning False on timeout"""
+    try:
+        await asyncio.wait_for(discord_ready.wait(),
+                               timeout=DISCORD_READY_TIMEOUT)
+        return True
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Discord client not ready after %s seconds", DISCORD_READY_TIMEOUT)
+        return False
+
+
+async def resolve_channel(channel_id: int):
+    """Look up a channel in the client cache, falling back to the Discord API"""
+    channel = client.get_channel(channel_id)
+    if channel is None:
+        try:
+            channel = await client.fetch_channel(channel_id)
+        except discord.DiscordException as e:
+            logger.error('Error fetching channel %s: %s', channel_id, e)
+    return channel
+
 
 @client.event
 async def on_ready():
@@ -145,20 +237,145 @@ async def on_ready():
     global changelog_channel, exp_boost_channel
     logger.info('🤖 Bot connected successfully!')
 
-    for guild in client.guilds:
-        for channel in guild.channels:
-            if channel.id == CHANGELOG_CHANNEL_ID:
-                changelog_channel = channel
-                logger.info('✅ Found changelog channel: %s', channel.name)
-            elif channel.id == EXP_BOOST_CHANNEL_ID:
-                exp_boost_channel = channel
-                logger.info('✅ Found exp boost channel: %s', channel.name)
+    changelog_channel = await resolve_channel(CHANGELOG_CHANNEL_ID)
+    if changelog_channel:
+        logger.info('✅ Found changelog channel: %s', changelog_channel.name)
+
+    if EXP_BOOST_CHANNEL_ID:
+        exp_boost_channel = await resolve_channel(EXP_BOOST_CHANNEL_ID)
+        if exp_boost_channel:
+            logger.info('✅ Found exp boost channel: %s',
+                        exp_boost_channel.name)
 
     if not changelog_channel:
         logger.error('❌ Could not find changelog channel!')
     if not exp_boost_channel:
         logger.error('❌ Could not find exp boost channel!')
 
+    if changelog_channel:
+        await load_recent_changelogs()
+
+    discord_ready.set()
+
+
+@client.event
+async def on_message(message):
+    """Keep the recent changelog cache current as new messages arrive"""
+    if message.channel.id != CHANGELOG_CHANNEL_ID:
+        return
+
+    async with recent_changelogs_lock:
+        # Skip messages the history backfill already picked up
+        if recent_changelogs and recent_changelogs[0]["id"] >= message.id:
+            return
+        recent_changelogs.appendleft(build_changelog_cache_entry(message))
+
+
+@client.event
+async def on_raw_message_edit(payload):
+    """Refresh a cached changelog message when it is edited"""
+    if payload.channel_id != CHANGELOG_CHANNEL_ID or not changelog_channel:
+        return
+
+    async with recent_changelogs_lock:
+        if not any(entry["id"] == payload.message_id for entry in recent_changelogs):
+            return
+
+    try:
+        message = await changelog_channel.fetch_message(payload.message_id)
+    except discord.DiscordException as e:
+        logger.error('Error fetching edited changelog message %s: %s',
+                     payload.message_id, e)
+        return
+
+    async with recent_changelogs_lock:
+        for index, entry in enumerate(recent_changelogs):
+            if entry["id"] == message.id:
+                recent_changelogs[index] = build_changelog_cache_entry(message)
+                break
+
+
+@client.event
+async def on_raw_message_delete(payload):
+    """Drop a deleted changelog message from the cache"""
+    if payload.channel_id != CHANGELOG_CHANNEL_ID:
+        return
+
+    async with recent_changelogs_lock:
+        for entry in recent_changelogs:
+            if entry["id"] == payload.message_id:
+                recent_changelogs.remove(entry)
+                break
+
+
+def build_changelog_cache_entry(message) -> dict:
+    """
+    Build the cached representation of a changelog message.
+    Includes the serialized /patcher/latest body so polls for an unchanged
+    message don't format or encode anything.
+    """
+    author = message.author.display_name
+    patcher_body = orjson.dumps({
+        "status": "success",
+        "found": True,
+        "changelog": {
+            "raw_content": message.content,
+            "formatted_content": format_changelog_for_wiki(
+                message.content, message.created_at, author),
+            "author": author,
+            "timestamp": message.created_at,
+            "message_id": str(message.id)
+        }
+    })
+    # Hashed from the body itself, so the tag changes whenever anything the
+    # endpoints return does (content, author name, ...), however close together
+    version = hashlib.blake2b(patcher_body, digest_size=8).hexdigest()
+    return {
+        "id": message.id,
+        "etag": f'"{message.id}-{version}"',
+        "content": message.content,
+        "author": author,
+        "created_at": message.created_at,
+        "patcher_body": patcher_body
+    }
+
+
+async def load_recent_changelogs():
+    """Seed the recent changelog cache from the changelog channel history"""
+    try:
+        async with recent_changelogs_lock:
+            entries = [
+                build_changelog_cache_entry(message)
+                async for message in changelog_channel.history(limit=RECENT_CHANGELOG_LIMIT)
+            ]
+            recent_changelogs.clear()
+            recent_changelogs.extend(entries)
+        logger.info('✅ Cached %d recent changelog messages', len(entries))
+    except Exception as e:
+        logger.error("Error loading recent changelog messages: %s", e)
+
+
+def changelog_unavailable_reason() -> Optional[str]:
+    """Return why the changelog cache can't be served yet, or None if it can"""
+    if not client.is_ready():
+        return "Discord client is not ready"
+    if not changelog_channel:
+        return "Changelog channel not found"
+    return None
+
+
+async def get_recent_changelogs(count: int = 1) -> list:
+    """Return up to `count` of the newest cached changelog entries, newest first"""
+    async with recent_changelogs_lock:
+        return list(islice(recent_changelogs, count))
+
+
+def token_matches(token: str) -> bool:
+    """Check a request token against PATCHER_TOKEN in constant time"""
+    if PATCHER_TOKEN_BYTES is None:
+        return False
+    return hmac.compare_digest(token.encode(), PATCHER_TOKEN_BYTES)
+
 
 class APILoggingMiddleware(BaseHTTPMiddleware):
     """Middleware to log all API requests with detailed information"""
@@ -176,15 +393,13 @@ class APILoggingMiddleware(BaseHTTPMiddleware):
             # Mask the token in logs for security
             token_value = request.headers["X-Patcher-Token"]
             masked_token = mask_sensitive_string(token_value)
-            auth_status = "authenticated" if token_value == PATCHER_TOKEN else f"invalid_token({masked_token})"
+            auth_status = "authenticated" if token_matches(token_value) else f"invalid_token({masked_token})"
 
-        # Log the request start
+        # Log the request start - through the queued logger, which the event
+        # loop never blocks on, rather than a flushed write to stderr
         request_id = f"{int(time.time() * 1000)}-{os.urandom(4).hex()}"
-        request_log = f"API Request #{request_id} | {request.method} {request.url.path} | From: {client_ip} | Auth: {auth_status}"
-        
-        # Use both logging methods for maximum visibility
-        logger.info(request_log)
-        print(request_log, file=sys.stderr, flush=True)
+        logger.info("API Request #%s | %s %s | From: %s | Auth: %s",
+                    request_id, request.method, request.url.path, client_ip, auth_status)
 
         # Process the request and measure time
         start_time = time.time()
@@ -193,36 +408,24 @@ class APILoggingMiddleware(BaseHTTPMiddleware):
             process_time = time.time() - start_time
 
             # Log successful response
-            response_log = (
-                f"API Response #{request_id} | {request.method} {request.url.path} | "
-                f"Status: {response.status_code} | Time: {process_time:.3f}s | Size: {response.headers.get('content-length', 'unknown')}"
-            )
-            
-            # Use multiple logging methods to ensure visibility in Azure
-            logger.info(response_log)
-            # Also print directly to stderr for maximum visibility in Azure logs
-            print(response_log, file=sys.stderr, flush=True)
+            logger.info("API Response #%s | %s %s | Status: %s | Time: %.3fs | Size: %s",
+                        request_id, request.method, request.url.path, response.status_code,
+                        process_time, response.headers.get('content-length', 'unknown'))
 
             return response
         except Exception as e:
             # Log exceptions
             process_time = time.time() - start_time
-            error_log = (
-                f"API Error #{request_id} | {request.method} {request.url.path} | "
-                f"Error: {str(e)} | Time: {process_time:.3f}s"
-            )
-            
-            # Use both logging methods for visibility
-            logger.error(error_log)
-            print(f"\n❌ {error_log}\n", file=sys.stderr, flush=True)
+            logger.error("❌ API Error #%s | %s %s | Error: %s | Time: %.3fs",
+                         request_id, request.method, request.url.path, e, process_time)
             # Log the traceback as well for better debugging
             logger.error(traceback.format_exc())
-            print(traceback.format_exc(), file=sys.stderr, flush=True)
             raise
 
 
 # Set up FastAPI
-app = FastAPI()
+# Serialize endpoint responses with orjson rather than the stdlib json module
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Add API logging middleware
 app.add_middleware(APILoggingMiddleware)
@@ -232,7 +435,7 @@ api_key_header = APIKeyHeader(name="X-Patcher-Token", auto_error=True)
 
 
 async def verify_token(api_key: str = Security(api_key_header)):
-    if api_key != PATCHER_TOKEN:
+    if not token_matches(api_key):
         raise HTTPException(
             status_code=401,
             detail="Invalid authentication token"
@@ -247,6 +450,43 @@ async def on_startup():
 
 
 @app.on_event("startup")
+async def create_http_session():
+    """Create the shared HTTP session used for all outbound requests."""
+    global http_session
+    http_session = aiohttp.ClientSession(
+        # Fail fast on unreachable hosts but leave room for large wiki pushes
+        timeout=aiohttp.ClientTimeout(total=30, connect=5),
+        json_serialize=lambda obj: orjson.dumps(obj).decode(),
+        connector=aiohttp.TCPConnector(
+            limit=20, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=75,
+            enable_cleanup_closed=True)
+    )
+
+
+@app.on_event("shutdown")
+async def close_http_session():
+    """Close the shared HTTP session."""
+    if http_session and not http_session.closed:
+        await http_session.close()
+
+
+# Background startup work, referenced here so the tasks aren't garbage collected
+startup_tasks = set()
+
+
+@app.on_event("startup")
+async def schedule_startup_files():
+    """
+    Create and populate changelog.md and ServerStatus.md in the background.
+    Both wait on Discord, and uvicorn won't accept connections (health probes
+    included) until every startup hook has returned.
+    """
+    for coro in (create_changelog_on_startup(), create_server_status_on_startup()):
+        task = asyncio.create_task(coro)
+        startup_tasks.add(task)
+        task.add_done_callback(startup_tasks.discard)
+
+
 async def create_changelog_on_startup():
     """Create and populate the changelog.md file during startup."""
     try:
@@ -266,20 +506,24 @@ async def create_changelog_on_startup():
 
             logger.info("✅ Initial changelog.md created successfully!")
         else:
-            logger.info(f"✓ changelog.md already exists at {CHANGELOG_PATH}")
+            logger.info("✓ changelog.md already exists at %s", CHANGELOG_PATH)
 
         # Now populate the file with changelog data from Discord
         logger.info("Fetching all changelogs to populate the file...")
         try:
-            # Wait a bit for the Discord client to be ready
-            await asyncio.sleep(5)
-
-            if client.is_ready() and changelog_channel:
-                # Fetch all messages directly from Discord
+            # Wait for the Discord client to be ready
+            channel = None
+            if await wait_for_discord_ready():
+                channel = changelog_channel or client.get_channel(
+                    CHANGELOG_CHANNEL_ID)
+
+            if channel:
+                # Fetch all messages directly from Discord, oldest first so
+                # they're already in chronological order
                 logger.info(
                     "Fetching messages from Discord changelog channel...")
                 messages = []
-                async for message in changelog_channel.history(limit=None):
+                async for message in channel.history(limit=None, oldest_first=True):
                     # Check if the message has meaningful content
                     if message.content.strip():
                         messages.append({
@@ -291,19 +535,20 @@ async def create_changelog_on_startup():
 
                 if messages:
                     logger.info(
-                        f"Found {len(messages)} changelog entries, updating the file...")
-
-                    # Sort messages by ID (chronological order)
-                    messages.sort(key=lambda x: int(x["id"]))
+                        "Found %s changelog entries, updating the file...", len(messages))
 
                     # Generate Markdown content
-                    markdown_content = "# Changelog\n\n"
-                    for log in messages:
-                        markdown_content += f"## Entry {log['id']}\n"
-                        markdown_content += f"**Author:** {log['author']}\n"
-                        markdown_content += f"**Date:** {log['timestamp']}\n\n"
-                        markdown_content += f"{log['content']}\n\n"
-                        markdown_content += "---\n\n"
+                    markdown_content = "".join([
+                        "# Changelog\n\n",
+                        *(
+                            f"## Entry {log['id']}\n"
+                            f"**Author:** {log['author']}\n"
+                            f"**Date:** {log['timestamp']}\n\n"
+                            f"{log['content']}\n\n"
+                            "---\n\n"
+                            for log in messages
+                        )
+                    ])
 
                     # Save to the markdown file
                     with open(CHANGELOG_PATH, "w") as md_file:
@@ -321,15 +566,14 @@ async def create_changelog_on_startup():
                     "The file will be populated when you call /generate-markdown endpoint manually")
         except Exception as e:
             logger.error(
-                f"Error populating changelog.md with entries: {str(e)}")
+                "Error populating changelog.md with entries: %s", e)
             logger.info(
                 "You can still manually update using the /generate-markdown endpoint")
 
     except Exception as e:
-        logger.error(f"Error managing changelog.md file: {str(e)}")
+        logger.error("Error managing changelog.md file: %s", e)
 
 
-@app.on_event("startup")
 async def create_server_status_on_startup():
     """Create and populate the ServerStatus.md file during startup."""
     try:
@@ -351,23 +595,34 @@ async def create_server_status_on_startup():
             logger.info("✅ Initial ServerStatus.md created successfully!")
         else:
             logger.info(
-                f"✓ ServerStatus.md already exists at {SERVER_STATUS_PATH}")
+                "✓ ServerStatus.md already exists at %s", SERVER_STATUS_PATH)
 
         # Now populate the file with the latest EXP boost data from Discord
         logger.info("Fetching latest EXP boost status to populate the file...")
         try:
-            # Wait a bit for the Discord client to be ready
-            await asyncio.sleep(5)
+            # Wait for the Discord client to be ready
+            channel = None
+            if await wait_for_discord_ready() and EXP_BOOST_CHANNEL_ID:
+                channel = exp_boost_channel or client.get_channel(
+                    EXP_BOOST_CHANNEL_ID)
 
-            if client.is_ready() and exp_boost_channel:
+            if channel:
                 # Fetch the latest message directly from Discord
                 logger.info(
                     "Fetching message from Discord EXP boost channel...")
-                messages = [message async for message in exp_boost_channel.history(limit=1)]
-
-                if messages:
-                    latest_message = messages[0]
-
+                # A direct GET by id when the gateway knows the channel's last
+                # message; otherwise (or if it was deleted) walk history
+                latest_message = None
+                if channel.last_message_id:
+                    try:
+                        latest_message = await channel.fetch_message(
+                            channel.last_message_id)
+                    except discord.NotFound:
+                        pass
+                if latest_message is None:
+                    latest_message = await anext(channel.history(limit=1), None)
+
+                if latest_message is not None:
                     # Generate the entry
                     logger.info(
                         "Creating ServerStatus.md entry from latest message...")
@@ -396,7 +651,7 @@ async def create_server_status_on_startup():
                             json.dump(data, f, indent=2)
                     except Exception as e:
                         logger.error(
-                            f"Error saving last_exp_boost.json: {str(e)}")
+                            "Error saving last_exp_boost.json: %s", e)
 
                     logger.info(
                         "✅ Successfully populated ServerStatus.md with latest EXP boost status!")
@@ -410,10 +665,10 @@ async def create_server_status_on_startup():
                     "The file will be populated when a new message arrives in the EXP boost channel")
         except Exception as e:
             logger.error(
-                f"Error populating ServerStatus.md with latest status: {str(e)}")
+                "Error populating ServerStatus.md with latest status: %s", e)
 
     except Exception as e:
-        logger.error(f"Error managing ServerStatus.md file: {str(e)}")
+        logger.error("Error managing ServerStatus.md file: %s", e)
 
 
 @app.get("/changelog/markdown", dependencies=[Depends(verify_token)])
@@ -478,9 +733,10 @@ async def generate_markdown():
         changelogs = changelogs_response.get("changelogs", [])
 
         # Generate Markdown content
-        markdown_content = "# Changelog\n\n"
-        for log in changelogs:
-            markdown_content += f"## Entry {log['id']}\n{log['content']}\n\n"
+        markdown_content = "".join([
+            "# Changelog\n\n",
+            *(f"## Entry {log['id']}\n{log['content']}\n\n" for log in changelogs)
+        ])
 
         # Save to a Markdown file
         with open(CHANGELOG_PATH, "w") as md_file:
@@ -488,7 +744,7 @@ async def generate_markdown():
 
         return {"status": "success", "message": "Markdown file generated."}
     except Exception as e:
-        logger.error(f"Error generating markdown: {str(e)}")
+        logger.error("Error generating markdown: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -544,7 +800,7 @@ async def get_exp_boost():
             }
 
     except Exception as e:
-        logger.error(f"Error fetching EXP boost status: {str(e)}")
+        logger.error("Error fetching EXP boost status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -558,259 +814,411 @@ async def get_exp_bonus():
     return await get_exp_boost()
 
 
+# Use the same proxy URL as the JS code
+SERVER_STATUS_URL = "https://api.codetabs.com/v1/proxy?quest=http://login.projecteq.net/servers/list"
+# /serverstatus answers from memory for SERVER_STATUS_TTL seconds; if the
+# upstream fails, the last good answer is served for up to SERVER_STATUS_STALE_TTL,
+# and the upstream isn't tried again until SERVER_STATUS_TTL after the failure
+SERVER_STATUS_TTL = 20
+SERVER_STATUS_STALE_TTL = 600
+# Upstream failures are retried this many times in total, backing off 1s, 2s, ...
+SERVER_STATUS_MAX_ATTEMPTS = 3
+# Our server's name in the server list; the bytes form lets us check the raw
+# response before paying to decode the whole list
+HEROES_JOURNEY_TAG = "Heroes' Journey [Multiclass"
+HEROES_JOURNEY_TAG_BYTES = HEROES_JOURNEY_TAG.encode()
+server_status_cache = {"fetched_at": 0.0, "response": None,
+                       "failed_at": 0.0, "error": None}
+server_status_lock = asyncio.Lock()
+
+
 @app.get("/serverstatus", dependencies=[Depends(verify_token)])
 async def get_server_status():
     """
     Get the current server status from Project EQ API
+    Responses are cached briefly, and a recent cached response is returned
+    if the upstream API is failing.
     Requires X-Patcher-Token header for authentication.
     """
+    # Held across the fetch so concurrent requests share one upstream call
+    async with server_status_lock:
+        now = time.monotonic()
+        cached = server_status_cache["response"]
+        age = now - server_status_cache["fetched_at"]
+        if cached is not None and age < SERVER_STATUS_TTL:
+            return cached
+
+        # A refresh failed recently - answer from that failure instead of
+        # running the whole retry cycle again for every poll during an outage
+        error = server_status_cache["error"]
+        if error is None or now - server_status_cache["failed_at"] >= SERVER_STATUS_TTL:
+            try:
+                result = await fetch_server_status_with_retry()
+            except HTTPException as e:
+                error = e
+                server_status_cache.update(failed_at=time.monotonic(), error=e)
+            else:
+                server_status_cache.update(
+                    fetched_at=time.monotonic(), response=result, error=None)
+                return result
+
+        if cached is not None and age < SERVER_STATUS_STALE_TTL:
+            logger.warning(
+                "Serving %.0fs old server status after upstream error: %s",
+                age, error.detail)
+            return cached
+        # A fresh exception each time rather than re-raising the stored one
+        raise HTTPException(status_code=error.status_code, detail=error.detail)
+
+
+async def fetch_server_status_with_retry() -> dict:
+    """Fetch the server status, retrying upstream failures with backoff and jitter"""
+    for attempt in range(1, SERVER_STATUS_MAX_ATTEMPTS + 1):
+        try:
+            return await fetch_server_status()
+        except HTTPException as e:
+            # Only 503s are upstream trouble; anything else won't improve on retry
+            if e.status_code != 503 or attempt == SERVER_STATUS_MAX_ATTEMPTS:
+                raise
+            delay = 2 ** (attempt - 1) + random.uniform(0, 1)
+            logger.warning(
+                "Server status fetch failed (attempt %s/%s), retrying in %.1fs",
+                attempt, SERVER_STATUS_MAX_ATTEMPTS, delay)
+            await asyncio.sleep(delay)
+
+
+async def fetch_server_status() -> dict:
+    """Fetch the server list from the Project EQ API and build the /serverstatus response"""
     try:
-        logger.info("\n=== Fetching Server Status ===")
+        logger.info("=== Fetching Server Status ===")
 
-        # Use the same proxy URL as the JS code
-        proxy_url = "https://api.codetabs.com/v1/proxy?quest=http://login.projecteq.net/servers/list"
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(proxy_url) as response:
-                if response.status != 200:
-                    logger.error(
-                        f"Failed to fetch server status. Status: {response.status}")
-                    raise HTTPException(
-                        status_code=503,
-                        detail="Failed to fetch server status"
-                    )
+        session = http_session
+        async with session.get(SERVER_STATUS_URL) as response:
+            if response.status != 200:
+                logger.error(
+                    "Failed to fetch server status. Status: %s", response.status)
+                raise HTTPException(
+                    status_code=503,
+                    detail="Failed to fetch server status"
+                )
 
-                data = await response.json()
-                logger.info("Successfully fetched server data")
+            raw = await response.read()
+            logger.info("Successfully fetched server data")
 
-                # Find the Heroes' Journey server
+            # Find the Heroes' Journey server - skip decoding entirely when
+            # it isn't anywhere in the payload
+            server = None
+            if HEROES_JOURNEY_TAG_BYTES in raw:
                 server = next(
-                    (s for s in data if "Heroes' Journey [Multiclass" in s.get(
+                    (s for s in orjson.loads(raw) if HEROES_JOURNEY_TAG in s.get(
                         'server_long_name', '')),
                     None
                 )
 
-                if not server:
-                    logger.warning(
-                        "Heroes' Journey server not found in response")
-                    return {
-                        "status": "success",
-                        "found": False,
-                        "message": "Server not found in response"
-                    }
-
-                logger.info(f"Found server: {server.get('server_long_name')}")
-                logger.info(f"Players online: {server.get('players_online')}")
-
+            if not server:
+                logger.warning(
+                    "Heroes' Journey server not found in response")
                 return {
                     "status": "success",
-                    "found": True,
-                    "server": {
-                        "name": server.get('server_long_name'),
-                        "players_online": server.get('players_online'),
-                        "last_updated": datetime.now().isoformat()
-                    }
+                    "found": False,
+                    "message": "Server not found in response"
+                }
+
+            logger.info("Found server: %s", server.get('server_long_name'))
+            logger.info("Players online: %s", server.get('players_online'))
+
+            return {
+                "status": "success",
+                "found": True,
+                "server": {
+                    "name": server.get('server_long_name'),
+                    "players_online": server.get('players_online'),
+                    "last_updated": datetime.now().isoformat()
                 }
+            }
 
+    except HTTPException:
+        raise
     except aiohttp.ClientError as e:
-        logger.error(f"Network error fetching server status: {str(e)}")
+        logger.error("Network error fetching server status: %s", e)
         raise HTTPException(
             status_code=503,
             detail="Failed to connect to server status API"
         )
     except Exception as e:
-        logger.error(f"Error fetching server status: {str(e)}")
+        logger.error("Error fetching server status: %s", e)
         raise HTTPException(
             status_code=500,
             detail=str(e)
         )
 
 
+def cache_headers(etag: str) -> dict:
+    """Headers for a revalidatable response: clients may keep it but must check back"""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def not_modified(request: Request, response: Response, etag: str) -> bool:
+    """Tag the response with an ETag and report whether the client already has it"""
+    response.headers.update(cache_headers(etag))
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match may list several tags and uses weak comparison
+    return any(tag.strip().removeprefix("W/") == etag
+               for tag in if_none_match.split(","))
+
+
 @app.get("/last-message", dependencies=[Depends(verify_token)])
-async def get_last_message():
+async def get_last_message(request: Request, response: Response):
     """
     Get the last message from the changelog channel
     Requires X-Patcher-Token header for authentication.
+    Honors If-None-Match with a 304 when the latest message hasn't changed.
     """
     try:
-        print("\n=== Attempting to read last message ===")
-        print(f"Channel ID we're looking for: {CHANGELOG_CHANNEL_ID}")
-
-        if not client.is_ready():
-            print("Discord client is not ready")
-            return {"status": "error", "message": "Discord client is not ready"}
-
-        if not changelog_channel:
-            print("Changelog channel not found")
-            return {"status": "error", "message": "Changelog channel not found"}
-
-        print(f"Found channel: {changelog_channel.name}")
-
-        # Get the last message
-        messages = [message async for message in changelog_channel.history(limit=1)]
-
-        if not messages:
-            print("No messages found")
+        logger.debug("=== Attempting to read last message ===")
+        logger.debug("Channel ID we're looking for: %s", CHANGELOG_CHANNEL_ID)
+
+        unavailable = changelog_unavailable_reason()
+        if unavailable:
+            logger.warning(unavailable)
+            return {"status": "error", "message": unavailable}
+
+        # Get the last message from the in-memory cache
+        recent = await get_recent_changelogs(1)
+        if not recent:
+            logger.info("No messages found")
             return {"status": "success", "message": "No messages found"}
+        last_message = recent[0]
 
-        last_message = messages[0]
-        print(f"Found message: {last_message.content[:100]}...")
+        if not_modified(request, response, last_message["etag"]):
+            return Response(status_code=304, headers=cache_headers(last_message["etag"]))
+
+        logger.debug("Found message: %s...", last_message['content'][:100])
 
         return {
             "status": "success",
             "message": {
-                "content": last_message.content,
-                "author": last_message.author.display_name,
-                "created_at": last_message.created_at.isoformat(),
-                "id": last_message.id
+                "content": last_message["content"],
+                "author": last_message["author"],
+                "created_at": last_message["created_at"],
+                "id": last_message["id"]
             }
         }
 
     except Exception as e:
-        print(f"Error reading last message: {str(e)}")
-        print(f"Full error details: {repr(e)}")
+        logger.error("Error reading last message: %s", e)
+        logger.debug("Full error details: %r", e)
         return {"status": "error", "message": str(e)}
 
 
 @app.get("/patcher/latest", dependencies=[Depends(verify_token)])
-async def get_latest_for_patcher():
+async def get_latest_for_patcher(request: Request, response: Response):
     """
     Secure endpoint for the patcher to get the latest changelog entry.
     Requires X-Patcher-Token header for authentication.
-    Returns the latest changelog message in a formatted structure.
+    Returns the latest changelog message in a formatted structure, or a 304
+    when If-None-Match matches the latest entry's ETag.
     """
     try:
-        print("\n=== Patcher requesting latest changelog ===")
-
-        if not client.is_ready():
-            raise HTTPException(
-                status_code=503, detail="Discord client is not ready")
-
-        if not changelog_channel:
-            raise HTTPException(
-                status_code=503, detail="Changelog channel not found")
+        logger.debug("=== Patcher requesting latest changelog ===")
 
-        messages = [message async for message in changelog_channel.history(limit=1)]
+        unavailable = changelog_unavailable_reason()
+        if unavailable:
+            raise HTTPException(status_code=503, detail=unavailable)
 
-        if not messages:
+        recent = await get_recent_changelogs(1)
+        if not recent:
             return {
                 "status": "success",
                 "found": False,
                 "message": "No changelog entries found"
             }
+        last_message = recent[0]
 
-        last_message = messages[0]
+        if not_modified(request, response, last_message["etag"]):
+            return Response(status_code=304, headers=cache_headers(last_message["etag"]))
 
-        formatted_content = format_changelog_for_wiki(
-            last_message.content,
-            last_message.created_at,
-            last_message.author.display_name
+        # Pre-serialized when the message was cached
+        return Response(
+            content=last_message["patcher_body"],
+            media_type="application/json",
+            headers=cache_headers(last_message["etag"])
         )
 
-        return {
-            "status": "success",
-            "found": True,
-            "changelog": {
-                "raw_content": last_message.content,
-                "formatted_content": formatted_content,
-                "author": last_message.author.display_name,
-                "timestamp": last_message.created_at.isoformat(),
-                "message_id": str(last_message.id)
-            }
-        }
-
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Error in patcher endpoint: {str(e)}")
-        print(f"Full error details: {repr(e)}")
+        logger.error("Error in patcher endpoint: %s", e)
+        logger.debug("Full error details: %r", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Parsed changelog.md entries sorted oldest first, with their integer IDs in a
+# parallel list, keyed by the file (mtime, size) they came from
+changelog_entries_cache = {"key": None, "entries": [], "ids": []}
+
+
+def changelog_file_key() -> Optional[tuple]:
+    """Return a (mtime, size) key identifying the current changelog.md, or None if missing"""
+    try:
+        stat = os.stat(CHANGELOG_PATH)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def load_changelog_entries(file_key: tuple) -> tuple[list, list]:
+    """
+    Parse changelog.md into entries with their complete raw content.
+    Returns the entries sorted by ID (chronological order) and the matching
+    list of integer IDs; both are reused until the file's (mtime, size) key changes.
+    """
+    if changelog_entries_cache["key"] == file_key:
+        return changelog_entries_cache["entries"], changelog_entries_cache["ids"]
+
+    # Read the changelog file content
+    with open(CHANGELOG_PATH, "r") as md_file:
+        content = md_file.read()
+
+    # Parse the content into changelog entries with complete raw content
+    messages = []
+
+    # Use regex pattern to find entries
+    entry_pattern = r"## Entry (\d+)[\s\S]*?(?=\n## Entry|$)"
+    entry_matches = re.finditer(entry_pattern, content)
+
+    for match in entry_matches:
+        full_entry = match.group(0).strip()
+        entry_id = match.group(1)
+
+        # Extract author and date
+        author_match = re.search(r"\*\*Author:\*\* (.*?)\n", full_entry)
+        date_match = re.search(r"\*\*Date:\*\* (.*?)\n", full_entry)
+
+        author = author_match.group(1) if author_match else "Unknown"
+        timestamp = date_match.group(1) if date_match else "Unknown"
+
+        # Get content part (everything after the header metadata)
+        content_part = re.sub(
+            r"^## Entry \d+\s+\*\*Author:\*\* .*?\s+\*\*Date:\*\* .*?\s+\n", "", full_entry, flags=re.DOTALL)
+
+        messages.append({
+            "id": entry_id,
+            "content": content_part.strip(),
+            "author": author,
+            "timestamp": timestamp,
+            "raw": full_entry
+        })
+
+    # Entries in the file are not guaranteed to be in order, so sort by ID
+    # once here rather than on every request
+    messages.sort(key=lambda m: int(m["id"]))
+    ids = [int(m["id"]) for m in messages]
+
+    # Log a summary instead of each individual entry
+    if messages:
+        logger.debug("Parsed %d changelog entries (IDs from %s to %s)",
+                     len(messages), messages[0]["id"], messages[-1]["id"])
+    else:
+        logger.debug("No changelog entries found")
+
+    changelog_entries_cache.update(key=file_key, entries=messages, ids=ids)
+    return messages, ids
+
+
 @app.get("/changelog/{message_id}", dependencies=[Depends(verify_token)])
 @app.get("/changelog", dependencies=[Depends(verify_token)])
-async def get_changelog(message_id: Optional[str] = None, all: Optional[bool] = False):
+async def stream_changelog(message_id: Optional[str] = None, all: Optional[bool] = False,
+                           limit: Optional[int] = Query(None, ge=1, le=1000),
+                           before: Optional[str] = None):
     """
     Get changelogs from the local changelog.md file.
     Can be called as either:
     - /changelog?message_id=1234567890
     - /changelog/1234567890
     - /changelog?all=true (to get all changelogs)
+    - /changelog?limit=20&before=1234567890 (to page back through older changelogs)
     If message_id is provided, returns all changelogs after that message.
     If no message_id is provided and all=false, returns the latest changelog.
     If all=true, returns all available changelogs.
+    before restricts the results to changelogs older than that message, and
+    limit caps how many are returned - the oldest ones when paging forward
+    from message_id, otherwise the newest ones.
+    The response is streamed one entry at a time so large listings are never
+    serialized into a single buffer.
     Requires X-Patcher-Token header for authentication.
     """
+    result = await get_changelog(message_id=message_id, all=all,
+                                 limit=limit, before=before)
+    return StreamingResponse(
+        iter_changelog_json(result["changelogs"]),
+        media_type="application/json"
+    )
+
+
+async def iter_changelog_json(changelogs: list):
+    """Serialize a changelog listing as JSON, yielding one entry at a time"""
+    yield b'{"status":"success","changelogs":['
+    for index, entry in enumerate(changelogs):
+        if index:
+            yield b','
+        yield orjson.dumps(entry)
+    yield b'],"total":%d}' % len(changelogs)
+
+
+async def get_changelog(message_id: Optional[str] = None, all: Optional[bool] = False,
+                        limit: Optional[int] = None, before: Optional[str] = None):
+    """
+    Get changelogs from the local changelog.md file.
+    If message_id is provided, returns all changelogs after that message.
+    If no message_id is provided and all=false, returns the latest changelog.
+    If all=true, returns all available changelogs.
+    before and limit narrow the results as described on the /changelog endpoint.
+    """
     try:
-        logger.info("\n=== Fetching Changelogs from local file ===")
+        logger.debug("=== Fetching Changelogs from local file ===")
 
         # Check if the changelog file exists
-        if not os.path.exists(CHANGELOG_PATH):
+        file_key = changelog_file_key()
+        if file_key is None:
             logger.error("Changelog file not found")
             raise HTTPException(
                 status_code=404, detail="Changelog file not found")
 
-        # Read the changelog file content
-        with open(CHANGELOG_PATH, "r") as md_file:
-            content = md_file.read()
-
-        # Parse the content into changelog entries with complete raw content
-        messages = []
-
-        # Use regex pattern to find entries
-        entry_pattern = r"## Entry (\d+)[\s\S]*?(?=\n## Entry|$)"
-        entry_matches = re.finditer(entry_pattern, content)
+        # Entries come back already sorted by ID (chronological order)
+        messages, ids = load_changelog_entries(file_key)
 
-        for match in entry_matches:
-            full_entry = match.group(0).strip()
-            entry_id = match.group(1)
-
-            # Extract author and date
-            author_match = re.search(r"\*\*Author:\*\* (.*?)\n", full_entry)
-            date_match = re.search(r"\*\*Date:\*\* (.*?)\n", full_entry)
-
-            author = author_match.group(1) if author_match else "Unknown"
-            timestamp = date_match.group(1) if date_match else "Unknown"
-
-            # Get content part (everything after the header metadata)
-            content_part = re.sub(
-                r"^## Entry \d+\s+\*\*Author:\*\* .*?\s+\*\*Date:\*\* .*?\s+\n", "", full_entry, flags=re.DOTALL)
-
-            messages.append({
-                "id": entry_id,
-                "content": content_part.strip(),
-                "author": author,
-                "timestamp": timestamp,
-                "raw": full_entry
-            })
-
-        # Log a summary instead of each individual entry
-        entry_ids = [m["id"] for m in messages]
-        if entry_ids:
-            logger.info(
-                f"Found {len(entry_ids)} changelog entries (IDs from {entry_ids[0]} to {entry_ids[-1]})")
-        else:
-            logger.info("No changelog entries found")
-
-        # Sort messages by ID (chronological order)
-        messages.sort(key=lambda x: int(x["id"]))
-
-        # Filter based on message_id if provided
-        if message_id:
-            try:
-                reference_id = int(message_id)
-                filtered_messages = [
-                    m for m in messages if int(m["id"]) > reference_id]
-                logger.info(
-                    f"Filtered to {len(filtered_messages)} entries after ID: {reference_id}")
-                messages = filtered_messages
-            except ValueError:
-                raise HTTPException(
-                    status_code=400, detail="Invalid message ID format")
+        try:
+            reference_id = int(message_id) if message_id else None
+            before_id = int(before) if before else None
+        except ValueError:
+            raise HTTPException(
+                status_code=400, detail="Invalid message ID format")
+
+        # Narrow to the (message_id, before) window - a slice of the sorted list
+        start = bisect_right(ids, reference_id) if reference_id is not None else 0
+        end = bisect_left(ids, before_id) if before_id is not None else len(ids)
+        messages = messages[start:end]
+
+        if reference_id is not None:
+            # Paging forward from message_id keeps the oldest entries
+            if limit:
+                messages = messages[:limit]
+            logger.debug("Filtered to %d entries after ID: %s",
+                         len(messages), reference_id)
+        elif limit:
+            # Otherwise keep the newest entries in the window
+            messages = messages[-limit:]
         elif not all:
             # If not all and no message_id, get only the latest
+            messages = messages[-1:]
             if messages:
-                messages = [messages[-1]]
-                logger.info(
-                    f"Returning only the latest changelog: {messages[0]['id']}")
+                logger.debug("Returning only the latest changelog: %s",
+                             messages[0]["id"])
 
         return {
             "status": "success",
@@ -818,50 +1226,130 @@ async def get_changelog(message_id: Optional[str] = None, all: Optional[bool] =
             "total": len(messages)
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error fetching changelogs: {str(e)}")
+        logger.error("Error fetching changelogs: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# The composed wiki page, keyed by the changelog.md (mtime, size) it was built from
+wiki_page_cache = {"key": None, "content": "", "total": 0}
+
+
+def build_wiki_changelog_page() -> tuple[str, int]:
+    """
+    Compose the full wiki changelog page from changelog.md, newest entry first.
+    Returns the page content and the number of entries in it; the result is
+    reused until changelog.md changes on disk.
+    """
+    file_key = changelog_file_key()
+    if file_key is None:
+        return "", 0
+    if wiki_page_cache["key"] == file_key:
+        return wiki_page_cache["content"], wiki_page_cache["total"]
+
+    entries, ids = load_changelog_entries(file_key)
+
+    # Format straight from the parsed entries in a single join rather than
+    # growing the (potentially multi-MB) page string entry by entry
+    formatted_content = "".join([
+        "# Changelog\n\n",
+        *(format_changelog_for_wiki(
+            entry["content"],
+            discord.utils.snowflake_time(entry_id),
+            entry["author"]
+        ) for entry, entry_id in zip(reversed(entries), reversed(ids)))
+    ])
+
+    wiki_page_cache.update(
+        key=file_key, content=formatted_content, total=len(entries))
+    return formatted_content, len(entries)
+
+
+# The wiki update currently in flight, shared by concurrent callers, and
+# whether it was forced
+wiki_update_task: Optional[asyncio.Task] = None
+wiki_update_forced = False
+
+# The changelog.md key of the page last pushed to the wiki, and when. An
+# unchanged page is not re-sent until WIKI_RESYNC_INTERVAL has passed, which
+# still overwrites out-of-band edits on the wiki side eventually.
+WIKI_RESYNC_INTERVAL = 3600
+wiki_push_state = {"key": None, "pushed_at": 0.0}
+
+
 @app.post("/wiki/update-changelog", dependencies=[Depends(verify_token)])
-async def update_wiki_with_all_changelogs():
+async def update_wiki_with_all_changelogs(force: bool = False):
     """
     Fetch all changelogs and update the wiki page with them.
+    Skips the push if the wiki already has the current changelog, unless
+    force=true is passed.
+    Requests that arrive while an update is already running wait for that
+    update and share its result instead of starting another one; a forced
+    request only shares a forced run.
     Requires X-Patcher-Token header for authentication.
     """
-    print("\n=== Starting Wiki Changelog Update ===")
+    global wiki_update_task, wiki_update_forced
 
     # Check if wiki integration is configured
-    if not all([WIKI_API_URL, WIKI_API_KEY, WIKI_PAGE_ID]):
+    if not WIKI_ENABLED:
         raise HTTPException(
             status_code=500,
             detail="Wiki integration is not fully configured. Please set WIKI_API_URL, WIKI_API_KEY, and WIKI_PAGE_ID."
         )
 
+    # An unforced run may skip the push, so a forced caller can't just share
+    # it - let it finish, then start (or join) a forced run of our own
+    while (force and not wiki_update_forced
+           and wiki_update_task is not None and not wiki_update_task.done()):
+        logger.info("Unforced wiki update in progress, forcing another after it")
+        # wait() doesn't cancel the task if this caller goes away, and
+        # doesn't raise its error - that run's callers already get it
+        await asyncio.wait([wiki_update_task])
+
+    if wiki_update_task is None or wiki_update_task.done():
+        wiki_update_task = asyncio.create_task(run_wiki_changelog_update(force))
+        wiki_update_forced = force
+    else:
+        logger.info("Wiki update already in progress, waiting for it")
+
+    # Shielded so a caller disconnecting doesn't cancel the shared update
+    return await asyncio.shield(wiki_update_task)
+
+
+async def run_wiki_changelog_update(force: bool = False) -> dict:
+    """Push the full changelog to the wiki page and return the endpoint response"""
+    logger.info("=== Starting Wiki Changelog Update ===")
+
     try:
-        # Get all changelogs using existing endpoint logic
-        changelogs = await get_changelog(all=True)
+        formatted_content, total = build_wiki_changelog_page()
 
-        if not changelogs["total"]:
+        if not total:
             return {
                 "status": "success",
                 "message": "No changelogs found to update"
             }
 
-        # Format all changelogs for wiki
-        formatted_content = "# Changelog\n\n"
-        for changelog in changelogs["changelogs"]:
-            formatted_content += changelog["formatted_content"]
+        page_key = wiki_page_cache["key"]
+        since_push = time.monotonic() - wiki_push_state["pushed_at"]
+        if not force and page_key == wiki_push_state["key"] and since_push < WIKI_RESYNC_INTERVAL:
+            logger.info("Wiki already has the current changelog, skipping update")
+            return {
+                "status": "success",
+                "message": f"Wiki already up to date with {total} changelog entries",
+                "total_entries": total
+            }
 
         # Update the wiki page
-        page_id = int(WIKI_PAGE_ID)
-        success = await update_wiki_page(formatted_content, page_id)
+        success = await update_wiki_page(formatted_content, WIKI_PAGE_ID_INT)
 
         if success:
+            wiki_push_state.update(key=page_key, pushed_at=time.monotonic())
             return {
                 "status": "success",
-                "message": f"Successfully updated wiki with {changelogs['total']} changelog entries",
-                "total_entries": changelogs["total"]
+                "message": f"Successfully updated wiki with {total} changelog entries",
+                "total_entries": total
             }
         else:
             raise HTTPException(
@@ -870,52 +1358,104 @@ async def update_wiki_with_all_changelogs():
             )
 
     except Exception as e:
-        print(f"❌ Error updating wiki with changelogs: {str(e)}")
+        logger.error("❌ Error updating wiki with changelogs: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Request bodies larger than this are gzip-compressed before being sent to Wiki.js
+WIKI_GZIP_THRESHOLD = 8 * 1024
+# Cap concurrent Wiki.js requests so bursts queue up instead of piling on
+wiki_semaphore = asyncio.Semaphore(4)
+# Attempts per Wiki.js request; transient failures back off 1s, 2s, ...
+WIKI_MAX_ATTEMPTS = 3
+
+
+# Update (with isPublished) and render the page in one round-trip. Both root
+# fields are aliased since they share the "pages" namespace.
+UPDATE_PAGE_MUTATION = """
+mutation UpdateAndRenderPage($id: Int!, $content: String!) {
+  update: pages {
+    update(id: $id, content: $content, isPublished: true) {
+      responseResult {
+        succeeded
+        errorCode
+        slug
+        message
+      }
+    }
+  }
+  render: pages {
+    render(id: $id) {
+      responseResult {
+        succeeded
+        message
+      }
+    }
+  }
+}
+"""
+
+
+def encode_wiki_payload(payload: dict) -> tuple[bytes, dict]:
+    """
+    Serialize a GraphQL payload for Wiki.js.
+    Returns the request body and any extra headers it needs; large bodies
+    (full changelog pages) are gzip-compressed since markdown shrinks well.
+    """
+    body = orjson.dumps(payload)
+    if len(body) < WIKI_GZIP_THRESHOLD:
+        return body, {}
+    return gzip.compress(body), {'Content-Encoding': 'gzip'}
+
+
+async def post_wiki_graphql(payload: dict) -> tuple[int, dict]:
+    """
+    POST a GraphQL payload to Wiki.js and return the HTTP status and JSON body.
+    5xx responses and connection errors are retried with exponential backoff.
+    """
+    body, body_headers = encode_wiki_payload(payload)
+    headers = {**WIKI_HEADERS, **body_headers}
+
+    async with wiki_semaphore:
+        for attempt in range(1, WIKI_MAX_ATTEMPTS + 1):
+            last_attempt = attempt == WIKI_MAX_ATTEMPTS
+            try:
+                async with http_session.post(WIKI_API_URL, data=body, headers=headers) as response:
+                    if response.status < 500 or last_attempt:
+                        return response.status, orjson.loads(await response.read())
+                    logger.warning("Wiki.js returned %s (attempt %d/%d)",
+                                   response.status, attempt, WIKI_MAX_ATTEMPTS)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if last_attempt:
+                    raise
+                logger.warning("Wiki.js request failed: %s (attempt %d/%d)",
+                               type(e).__name__, attempt, WIKI_MAX_ATTEMPTS)
+            await asyncio.sleep(2 ** (attempt - 1))
+
+
 async def update_wiki_page(content: str, page_id: int) -> bool:
     """
     Update the specified wiki page with new content and render it to make it visible.
     Returns True if successful, False otherwise.
     """
     try:
-        logger.info(f"\n=== Wiki Page Update Process ===")
-        logger.info(f"Target Page ID: {page_id}")
+        logger.info("=== Wiki Page Update Process ===")
+        logger.info("Target Page ID: %s", page_id)
 
         # Validate content
         if not content or not isinstance(content, str):
             logger.error("Invalid content provided to update_wiki_page")
             return False
 
-        headers = {
-            'Authorization': f'Bearer {WIKI_API_KEY}',
-            'Content-Type': 'application/json'
-        }
+        logger.info("Content length: %d characters", len(content))
 
-        # Log detailed content analysis
-        logger.info("Content Analysis:")
-        logger.info(f"- Total length: {len(content)} characters")
-        logger.info(f"- First 100 chars: {content[:100]}")
-        logger.info(
-            f"- Last 100 chars: {content[-100:] if len(content) > 100 else content}")
-        logger.info("- Number of lines: {}".format(content.count('\n') + 1))
-
-        # Update mutation with isPublished
-        update_mutation = """
-        mutation UpdatePage($id: Int!, $content: String!) {
-          pages {
-            update(id: $id, content: $content, isPublished: true) {
-              responseResult {
-                succeeded
-                errorCode
-                slug
-                message
-              }
-            }
-          }
-        }
-        """
+        # Log detailed content analysis - counting lines walks the whole
+        # page, so only do it when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Content Analysis:")
+            logger.debug("- First 100 chars: %s", content[:100])
+            logger.debug("- Last 100 chars: %s", content[-100:])
+            logger.debug("- Number of lines: %d", content.count('\n') + 1)
 
         variables = {
             "id": page_id,
@@ -923,121 +1463,97 @@ async def update_wiki_page(content: str, page_id: int) -> bool:
         }
 
         # Log request details
-        logger.info("\nRequest Details:")
-        logger.info(f"- API URL: {WIKI_API_URL}")
-        logger.info(f"- Update Mutation: {update_mutation.strip()}")
-        logger.info(
-            f"- Variables: id={page_id}, content_length={len(content)}")
-
-        async with aiohttp.ClientSession() as session:
-            # Step 1: Update content with isPublished
-            logger.info("\nExecuting update mutation...")
-            async with session.post(
-                WIKI_API_URL,
-                json={"query": update_mutation, "variables": variables},
-                headers=headers
-            ) as response:
-                response_status = response.status
-                response_data = await response.json()
-
-                logger.info(f"\nUpdate Response Analysis:")
-                logger.info(f"- HTTP Status: {response_status}")
-                logger.info(
-                    f"- Raw Response: {json.dumps(response_data, indent=2)}")
-
-                if 'errors' in response_data:
-                    logger.error("\nGraphQL Errors in update:")
-                    for error in response_data['errors']:
-                        logger.error(f"- Path: {error.get('path', 'N/A')}")
-                        logger.error(
-                            f"- Message: {error.get('message', 'N/A')}")
-                        logger.error(
-                            f"- Extensions: {error.get('extensions', {})}")
-                    return False
-
-                update_result = response_data.get('data', {}).get(
-                    'pages', {}).get('update', {}).get('responseResult', {})
-
-                # Continue even if we get the map error, as we know the update still works
-                if update_result.get('message') == "Cannot read properties of undefined (reading 'map')":
-                    logger.warning(
-                        "\n⚠️ Received 'map' error but continuing as this is expected")
-                elif not update_result.get('succeeded', False):
-                    logger.error(
-                        f"\n❌ Failed to update page: {update_result.get('message', 'Unknown error')}")
-                    return False
-
-                # Step 2: Render the page
-                render_mutation = """
-                mutation RenderPage($id: Int!) {
-                  pages {
-                    render(id: $id) {
-                      responseResult {
-                        succeeded
-                        message
-                      }
-                    }
-                  }
-                }
-                """
+        logger.info("Request Details:")
+        logger.info("- API URL: %s", WIKI_API_URL)
+        logger.debug("- Update Mutation: %s", UPDATE_PAGE_MUTATION)
+        logger.info("- Variables: id=%s, content_length=%d",
+                    page_id, len(content))
+
+        # Update and render in a single request - GraphQL runs mutation
+        # fields in order, so the render always sees the updated content
+        logger.info("Executing update and render mutation...")
+        response_status, response_data = await post_wiki_graphql(
+            {"query": UPDATE_PAGE_MUTATION, "variables": variables})
+
+        logger.info("Update Response Analysis:")
+        logger.info("- HTTP Status: %s", response_status)
+        # Re-serializing the whole response is only worth it when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("- Raw Response: %s", json.dumps(response_data))
+
+        if 'errors' in response_data:
+            logger.error("GraphQL Errors in update:")
+            for error in response_data['errors']:
+                logger.error("- Path: %s", error.get('path', 'N/A'))
+                logger.error("- Message: %s", error.get('message', 'N/A'))
+                logger.error("- Extensions: %s", error.get('extensions', {}))
+            return False
 
-                render_variables = {
-                    "id": page_id
-                }
+        data = response_data.get('data') or {}
+        update_result = data.get('update', {}).get(
+            'update', {}).get('responseResult', {})
+        render_result = data.get('render', {}).get(
+            'render', {}).get('responseResult', {})
+
+        # Continue even if we get the map error, as we know the update still works
+        if update_result.get('message') == "Cannot read properties of undefined (reading 'map')":
+            logger.warning(
+                "⚠️ Received 'map' error but continuing as this is expected")
+        elif not update_result.get('succeeded', False):
+            logger.error("❌ Failed to update page: %s",
+                         update_result.get('message', 'Unknown error'))
+            return False
 
-                logger.info("\nExecuting render mutation...")
-                async with session.post(
-                    WIKI_API_URL,
-                    json={"query": render_mutation,
-                          "variables": render_variables},
-                    headers=headers
-                ) as render_response:
-                    render_status = render_response.status
-                    render_data = await render_response.json()
-
-                    logger.info(f"\nRender Response Analysis:")
-                    logger.info(f"- HTTP Status: {render_status}")
-                    logger.info(
-                        f"- Raw Response: {json.dumps(render_data, indent=2)}")
-
-                    if 'errors' in render_data:
-                        logger.error("\nGraphQL Errors in render:")
-                        for error in render_data['errors']:
-                            logger.error(f"- Path: {error.get('path', 'N/A')}")
-                            logger.error(
-                                f"- Message: {error.get('message', 'N/A')}")
-                            logger.error(
-                                f"- Extensions: {error.get('extensions', {})}")
-                        return False
-
-                    render_result = render_data.get('data', {}).get(
-                        'pages', {}).get('render', {}).get('responseResult', {})
-
-                    if not render_result.get('succeeded', False):
-                        logger.error(
-                            f"\n❌ Failed to render page: {render_result.get('message', 'Unknown error')}")
-                        return False
+        if not render_result.get('succeeded', False):
+            logger.error("❌ Failed to render page: %s",
+                         render_result.get('message', 'Unknown error'))
+            return False
 
-                    logger.info("\n✅ Successfully rendered page")
-                    return True
+        logger.info("✅ Successfully rendered page")
+        return True
 
     except Exception as e:
-        logger.error(f"❌ Error in update_wiki_page: {type(e).__name__}")
-        logger.error(f"Error details: {str(e)}")
+        logger.error("❌ Error in update_wiki_page: %s", type(e).__name__)
+        logger.error("Error details: %s", e)
         return False
 
 
+# Reconnect backoff for the Discord client: doubles per consecutive failure up
+# to DISCORD_MAX_BACKOFF seconds, and resets once a connection has stayed up
+# for DISCORD_STABLE_SECONDS
+DISCORD_MAX_BACKOFF = 300
+DISCORD_STABLE_SECONDS = 60
+
+
 async def start_discord():
-    """Start the Discord client"""
-    try:
-        print("\n🔄 Starting Discord client...")
-        await client.start(TOKEN)
-    except discord.LoginFailure:
-        print("\n❌ Failed to log in to Discord!")
-        raise
-    except Exception as e:
-        print(f"\n❌ Connection error: {type(e).__name__}")
-        raise
+    """Start the Discord client, restarting it with backoff if it fails"""
+    failures = 0
+    while True:
+        started_at = time.monotonic()
+        try:
+            logger.info("🔄 Starting Discord client...")
+            await client.start(TOKEN)
+            # start() only returns once the client has been closed on purpose
+            return
+        except discord.LoginFailure:
+            # A bad token won't fix itself, so don't retry
+            logger.error("❌ Failed to log in to Discord!")
+            raise
+        except Exception as e:
+            logger.error("❌ Connection error: %s", type(e).__name__)
+
+        if time.monotonic() - started_at > DISCORD_STABLE_SECONDS:
+            failures = 0
+        failures += 1
+        delay = min(DISCORD_MAX_BACKOFF, 2 ** failures) + random.uniform(0, 1)
+        logger.info("Restarting Discord client in %.1fs (attempt %d)",
+                    delay, failures)
+
+        # Reset the client so start() can be called again
+        if not client.is_closed():
+            await client.close()
+        client.clear()
+        await asyncio.sleep(delay)
 
 
 async def start_api():
@@ -1049,10 +1565,10 @@ async def start_api():
         
         # Log configuration clearly for debugging
         logger.info("\n=== FastAPI Server Configuration ===")
-        logger.info(f"Host: 0.0.0.0")
-        logger.info(f"PORT env variable: {os.getenv('PORT')}")
+        logger.info("Host: 0.0.0.0")
+        logger.info("PORT env variable: %s", os.getenv('PORT'))
         port_to_use = int(os.getenv('PORT', '80'))
-        logger.info(f"Using port: {port_to_use}")
+        logger.info("Using port: %s", port_to_use)
 
         # Add a health check endpoint
         @app.get("/health")
@@ -1060,8 +1576,9 @@ async def start_api():
             """Health check endpoint for Azure"""
             now = datetime.now()
             
-            # Log the health check with our enhanced logging
-            force_azure_log(f"Health check request received at {now.isoformat()}")
+            # Log the health check through the queued logger, which already
+            # reaches Azure via stdout
+            logger.info("Health check request received at %s", now.isoformat())
             
             # Collect additional health data
             health_data = {
@@ -1077,8 +1594,8 @@ async def start_api():
             if hasattr(app, "routes"):
                 health_data["endpoints"] = len(app.routes)
                 
-            # Force log the response too
-            force_azure_log(f"Health check response: {json.dumps(health_data)}")
+            # Log the response too
+            logger.info("Health check response: %s", health_data)
             
             return health_data
 
@@ -1088,19 +1605,25 @@ async def start_api():
             host="0.0.0.0",  # Bind to all interfaces
             port=port_to_use,
             log_level="info",
-            access_log=True,
+            # The request middleware already logs every call
+            access_log=False,
             timeout_keep_alive=65,  # Increased timeout for Azure health checks
+            backlog=2048,
+            # httptools' C parser when installed, pure-Python h11 otherwise
+            http="httptools" if importlib.util.find_spec("httptools") else "h11",
         )
 
-        logger.info("Starting Discord client in background...")
-        asyncio.create_task(start_discord())
-
-        logger.info(f"🚀 Starting FastAPI server...")
+        # Run the Discord client alongside the server in a task group, so a
+        # fatal Discord error (e.g. a bad token) stops the API too instead of
+        # leaving it serving without a bot
+        logger.info("🚀 Starting FastAPI server and Discord client...")
         server = uvicorn.Server(config)
-        await server.serve()
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(start_discord())
+            tg.create_task(server.serve())
     except Exception as e:
-        logger.error(f"❌ Failed to start FastAPI server: {str(e)}")
-        logger.error(f"Error type: {type(e).__name__}")
+        logger.error("❌ Failed to start FastAPI server: %s", e)
+        logger.error("Error type: %s", type(e).__name__)
         raise
 
 
@@ -1113,7 +1636,7 @@ def import_reddit_poster():
         spec.loader.exec_module(reddit_module)
         return reddit_module
     except Exception as e:
-        logger.error(f"Error importing Reddit poster: {str(e)}")
+        logger.error("Error importing Reddit poster: %s", e)
         logger.error(traceback.format_exc())
         return None
 
@@ -1133,9 +1656,9 @@ async def post_to_reddit(entry_id: Optional[str] = None, force: bool = False, ba
     """
     try:
         logger.info("\n=== Posting to Reddit ===")
-        logger.info(f"Entry ID: {entry_id if entry_id else 'Latest'}")
-        logger.info(f"Force mode: {force}")
-        logger.info(f"Batch mode: {batch}")
+        logger.info("Entry ID: %s", entry_id or 'Latest')
+        logger.info("Force mode: %s", force)
+        logger.info("Batch mode: %s", batch)
 
         # Import the Reddit poster
         reddit_poster = import_reddit_poster()
@@ -1160,7 +1683,7 @@ async def post_to_reddit(entry_id: Optional[str] = None, force: bool = False, ba
                     status_code=404, detail="No changelog entries found")
             entry = changelogs["changelogs"][0]
 
-        logger.info(f"Processing entry: {entry['id']} by {entry['author']}")
+        logger.info("Processing entry: %s by %s", entry['id'], entry['author'])
 
         # If batch mode is disabled, use the original single-entry logic
         if not batch:
@@ -1205,7 +1728,7 @@ async def post_to_reddit(entry_id: Optional[str] = None, force: bool = False, ba
         # Re-raise HTTP exceptions as-is
         raise
     except Exception as e:
-        logger.error(f"Error posting to Reddit: {str(e)}")
+        logger.error("Error posting to Reddit: %s", e)
         logger.error(traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
     
@@ -1261,7 +1784,7 @@ async def post_all_entries_to_reddit():
             "results": results
         }
     except Exception as e:
-        logger.error(f"Error posting to Reddit: {str(e)}")
+        logger.error("Error posting to Reddit: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 async def check_recent_reddit_posts(entry_id):
@@ -1296,16 +1819,16 @@ async def check_recent_reddit_posts(entry_id):
             post_count += 1
             # Check if the post body contains our entry ID
             if hasattr(submission, 'selftext') and f"Entry ID:** {entry_id}" in submission.selftext:
-                logger.warning(f"Found duplicate post for entry {entry_id}: {submission.url}")
+                logger.warning("Found duplicate post for entry %s: %s", entry_id, submission.url)
                 await reddit.close()
                 return True
         
-        logger.info(f"Checked {post_count} recent posts, no duplicates found for entry {entry_id}")
+        logger.info("Checked %s recent posts, no duplicates found for entry %s", post_count, entry_id)
         await reddit.close()
         return False
         
     except Exception as e:
-        logger.error(f"Error checking for duplicate posts: {str(e)}")
+        logger.error("Error checking for duplicate posts: %s", e)
         # Don't block posting if duplicate check fails
         return False
     
@@ -1328,7 +1851,7 @@ async def get_posted_entries():
             "posts": posted_entries.get("posts", [])
         }
     except Exception as e:
-        logger.error(f"Error getting posted entries: {str(e)}")
+        logger.error("Error getting posted entries: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/reddit/test", dependencies=[Depends(verify_token)])
@@ -1348,9 +1871,9 @@ async def test_reddit_posting(background_tasks: BackgroundTasks,
     """
     try:
         logger.info("\n=== TESTING REDDIT INTEGRATION ===")
-        logger.info(f"Test Mode: {test_mode}")
-        logger.info(f"Using Real Data: {use_real_data}")
-        logger.info(f"Entry ID: {entry_id if entry_id else 'Not specified'}")
+        logger.info("Test Mode: %s", test_mode)
+        logger.info("Using Real Data: %s", use_real_data)
+        logger.info("Entry ID: %s", entry_id or 'Not specified')
         
         # Import the Reddit poster
         reddit_poster = import_reddit_poster()
@@ -1379,7 +1902,7 @@ async def test_reddit_posting(background_tasks: BackgroundTasks,
                 "raw": "Test raw content"
             }
         
-        logger.info(f"Test data prepared: Entry ID '{test_data['id']}' by {test_data['author']}")
+        logger.info("Test data prepared: Entry ID '%s' by %s", test_data['id'], test_data['author'])
         
         if test_mode:
             # Simulate posting
@@ -1390,7 +1913,7 @@ async def test_reddit_posting(background_tasks: BackgroundTasks,
             success, message = await reddit_poster.post_changelog_to_reddit(test_data)
             return {"status": "success" if success else "error", "message": message}
     except Exception as e:
-        logger.error(f"Error in test_reddit_posting: {str(e)}")
+        logger.error("Error in test_reddit_posting: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/reddit/test-pin/{post_id}", dependencies=[Depends(verify_token)])
@@ -1404,7 +1927,7 @@ async def test_pin_reddit_post(post_id: str):
         if not reddit_poster:
             raise HTTPException(status_code=500, detail="Failed to import Reddit poster module")
         # Simulate pinning (replace with actual logic if available)
-        logger.info(f"Simulating pinning Reddit post with ID: {post_id}")
+        logger.info("Simulating pinning Reddit post with ID: %s", post_id)
         # If reddit_poster has a pin_post method, call it here
         if hasattr(reddit_poster, "pin_post"):
             success, message = await reddit_poster.pin_post(post_id)
@@ -1412,7 +1935,7 @@ async def test_pin_reddit_post(post_id: str):
         else:
             return {"status": "success", "message": f"Simulated pin for post {post_id}"}
     except Exception as e:
-        logger.error(f"Error in test_pin_reddit_post: {str(e)}")
+        logger.error("Error in test_pin_reddit_post: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/reddit/test-flair", dependencies=[Depends(verify_token)])
@@ -1434,7 +1957,7 @@ async def test_reddit_flair():
         else:
             return {"status": "success", "message": "Simulated setting Reddit flair"}
     except Exception as e:
-        logger.error(f"Error in test_reddit_flair: {str(e)}")
+        logger.error("Error in test_reddit_flair: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/heartbeat")
@@ -1446,11 +1969,9 @@ async def heartbeat():
     try:
         # Log this heartbeat to ensure it's visible in Azure logs
         timestamp = datetime.now().isoformat()
-        heartbeat_msg = f"External heartbeat check received at {timestamp}"
-        logger.info(heartbeat_msg)
-        # Also log to stderr for visibility in Azure
-        print(heartbeat_msg, file=sys.stderr, flush=True)
-        
+        # The root logger already writes to stdout, which Azure collects
+        logger.info("External heartbeat check received at %s", timestamp)
+
         return {
             "status": "alive", 
             "timestamp": timestamp, 
@@ -1458,7 +1979,7 @@ async def heartbeat():
             "version": "1.0"
         }
     except Exception as e:
-        logger.error(f"Error in heartbeat endpoint: {str(e)}")
+        logger.error("Error in heartbeat endpoint: %s", e)
         return {"status": "error", "message": str(e)}
 
 
@@ -1487,7 +2008,7 @@ async def detailed_heartbeat():
                 log_files = [f for f in os.listdir(log_dir) if f.endswith('.log')]
                 log_files = [{"name": f, "size": os.path.getsize(os.path.join(log_dir, f))} for f in log_files]
         except Exception as e:
-            logger.error(f"Error reading log files: {str(e)}")
+            logger.error("Error reading log files: %s", e)
         
         # Last heartbeats (placeholder)
         last_heartbeats = {
@@ -1508,7 +2029,7 @@ async def detailed_heartbeat():
                         reddit_info = result
         except Exception as e:
             reddit_info = {"status": "error", "message": str(e)}
-            logger.error(f"Error getting Reddit info: {str(e)}")
+            logger.error("Error getting Reddit info: %s", e)
         
         return {
             "status": "alive",
@@ -1523,44 +2044,10 @@ async def detailed_heartbeat():
             "reddit_info": reddit_info
         }
     except Exception as e:
-        logger.error(f"Error in detailed_heartbeat: {str(e)}")
+        logger.error("Error in detailed_heartbeat: %s", e)
         logger.error(traceback.format_exc())
         return {"status": "error", "message": str(e)}
     except Exception as e:
-        logger.error(f"Error in detailed heartbeat: {str(e)}")
+        logger.error("Error in detailed heartbeat: %s", e)
         logger.error(traceback.format_exc())
         return {"status": "error", "message": str(e), "traceback": traceback.format_exc()}
-
-# Add a special function to ensure logs are visible in Azure
-def force_azure_log(message, level="info", include_timestamp=True):
-    """Force log to multiple outputs to ensure visibility in Azure"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S") if include_timestamp else ""
-    
-    # Use standard logger first
-    if level.lower() == "info":
-        logger.info(message)
-    elif level.lower() == "warning":
-        logger.warning(message)
-    elif level.lower() == "error":
-        logger.error(message)
-    elif level.lower() == "critical":
-        logger.critical(message)
-    else:
-        logger.info(message)
-    
-    # Then force output to stderr for Azure visibility
-    if timestamp:
-        output = f"{timestamp} [{level.upper()}]: {message}"
-    else:
-        output = message
-        
-    # Print directly to both stdout and stderr with flush
-    print(output, flush=True)
-    print(output, file=sys.stderr, flush=True)
-    
-    # For important events, make them visually distinct
-    if level.lower() in ["warning", "error", "critical"]:
-        visual_marker = "❌" if level.lower() in ["error", "critical"] else "⚠️"
-        separator = "-" * 80
-        distinctive_output = f"\n{separator}\n{visual_marker} {output}\n{separator}\n"
-        print(distinctive_output, file=sys.stderr, flush=True)
@@ -91,6 +91,14 @@ def force_azure_heartbeat_log(message):
 
 async def dedicated_heartbeat_logger():
     """Log heartbeats at regular intervals"""
+    # One session for the lifetime of the logger, so the periodic API health
+    # checks reuse a kept-alive connection instead of reconnecting each time
+    async with aiohttp.ClientSession() as session:
+        await run_heartbeat_loop(session)
+
+
+async def run_heartbeat_loop(session: aiohttp.ClientSession):
+    """Log the startup checks and then heartbeats forever, using the given session"""
     startup_msg = "Starting dedicated Azure heartbeat logger"
     force_azure_heartbeat_log(startup_msg)
     
@@ -101,14 +109,13 @@ async def dedicated_heartbeat_logger():
     try:
         api_health_status = "Unknown"
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get('http://localhost/health', timeout=2) as resp:
-                    if resp.status == 200:
-                        api_health_status = "Healthy"
-                        api_data = await resp.json()
-                        force_azure_heartbeat_log(f"FastAPI service is running: {api_data}")
-                    else:
-                        api_health_status = f"Unhealthy (Status: {resp.status})"
+            async with session.get('http://localhost/health', timeout=2) as resp:
+                if resp.status == 200:
+                    api_health_status = "Healthy"
+                    api_data = await resp.json()
+                    force_azure_heartbeat_log(f"FastAPI service is running: {api_data}")
+                else:
+                    api_health_status = f"Unhealthy (Status: {resp.status})"
         except Exception as e:
             api_health_status = f"Not responding ({str(e)})"
         
@@ -142,18 +149,14 @@ async def dedicated_heartbeat_logger():
             # Check API every 5th heartbeat
             if count % 5 == 0:
                 try:
-                    async with aiohttp.ClientSession() as session:
-                        try:
-                            async with session.get('http://localhost/health', timeout=2) as resp:
-                                if resp.status == 200:
-                                    data = await resp.json()
-                                    force_azure_heartbeat_log(f"API health check: Healthy - {data}")
-                                else:
-                                    force_azure_heartbeat_log(f"API health check: Unhealthy - Status {resp.status}")
-                        except Exception as e:
-                            force_azure_heartbeat_log(f"API health check failed: {str(e)}")
+                    async with session.get('http://localhost/health', timeout=2) as resp:
+                        if resp.status == 200:
+                            data = await resp.json()
+                            force_azure_heartbeat_log(f"API health check: Healthy - {data}")
+                        else:
+                            force_azure_heartbeat_log(f"API health check: Unhealthy - Status {resp.status}")
                 except Exception as e:
-                    force_azure_heartbeat_log(f"Could not perform API check: {str(e)}")
+                    force_azure_heartbeat_log(f"API health check failed: {str(e)}")
             
             # Build multi-line status message
             status_lines = [
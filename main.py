@@ -185,16 +185,15 @@ async def main():
     
     # Run both the Discord bot and Patcher API as separate services
     try:
-        # Start both services concurrently
-        discord_task = asyncio.create_task(run_discord_bot())
-        api_task = asyncio.create_task(run_api_server())
-        
-        # Log that tasks are created
-        print("AZURE_STARTUP: Created async tasks for discord_bot and api_server")
-        sys.stdout.flush()
-        
-        # Wait for both to complete (they should run indefinitely)
-        await asyncio.gather(discord_task, api_task)
+        # Start both services concurrently; the task group cancels the
+        # surviving service if the other one fails instead of leaking it
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(run_discord_bot())
+            tg.create_task(run_api_server())
+
+            # Log that tasks are created
+            print("AZURE_STARTUP: Created async tasks for discord_bot and api_server")
+            sys.stdout.flush()
     except Exception as e:
         logger.error(f"Error in main: {e}")
         print(f"AZURE ERROR: Error in main process: {e}")
@@ -203,4 +202,12 @@ async def main():
 
 if __name__ == "__main__":
     logger.info("Application starting...")
+    # Both services share this process's event loop, so use uvloop when it's
+    # available (it isn't on Windows); asyncio's own loop is the fallback
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        logger.info("uvloop not installed, using default asyncio event loop")
     asyncio.run(main())
\ No newline at end of file